@@ -4,7 +4,7 @@ from abc import ABC, abstractmethod
 from typing import Generic, TypeVar
 
 import numpy as np
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 from scipy.optimize import Bounds
 
 from quantflow.utils.marginal import Marginal1D, default_bounds
@@ -122,6 +122,18 @@ class StochasticProcess1DMarginal(Marginal1D, Generic[P]):
     model_config = ConfigDict(arbitrary_types_allowed=True)
     process: P
     t: FloatArrayLike
+    _std: FloatArrayLike | None = PrivateAttr(default=None)
+
+    def std(self) -> FloatArrayLike:
+        """Standard deviation at a time horizon
+
+        Cached on the instance since both the process and the time horizon
+        are fixed, while support and frequency range evaluations request it
+        repeatedly.
+        """
+        if self._std is None:
+            self._std = np.sqrt(self.variance())
+        return self._std
 
     def std_norm(self) -> Vector:
         """Standard deviation at a time horizon normalized by the time"""
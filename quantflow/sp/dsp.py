@@ -39,7 +39,7 @@ class DSP(PoissonBase):
         phi = self.poisson.characteristic_exponent(t, u)
         return -self.intensity.integrated_log_laplace(t, phi)
 
-    def arrivals(self, t: float = 1) -> list[float]:
+    def arrivals(self, t: float = 1) -> FloatArray:
         paths = self.intensity.sample(1, t, math.ceil(100 * t)).integrate()
         intensity = paths.data[-1, 0]
         return poisson_arrivals(intensity, t)
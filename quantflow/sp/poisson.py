@@ -8,7 +8,6 @@ from scipy.optimize import Bounds
 from scipy.stats import poisson
 
 from ..utils.distributions import Distribution1D
-from ..utils.functions import factorial
 from ..utils.paths import Paths
 from ..utils.transforms import TransformResult
 from ..utils.types import FloatArray, FloatArrayLike, Vector
@@ -16,6 +15,8 @@ from .base import Im, StochasticProcess1D, StochasticProcess1DMarginal
 
 D = TypeVar("D", bound=Distribution1D)
 
+_rng = np.random.default_rng()
+
 
 class PoissonBase(StochasticProcess1D):
     @abstractmethod
@@ -23,23 +24,26 @@ class PoissonBase(StochasticProcess1D):
         """Generate a list of jump sizes"""
 
     @abstractmethod
-    def arrivals(self, time_horizon: float = 1) -> list[float]:
-        """Generate a list of jump arrivals times up to time t"""
+    def arrivals(self, time_horizon: float = 1) -> FloatArray:
+        """Generate an array of jump arrival times up to time t"""
+
+    def arrivals_batch(self, n: int, time_horizon: float = 1) -> list[FloatArray]:
+        """Generate jump arrival times for several paths
+
+        Subclasses with a constant intensity can override this method to
+        draw all paths in one batch.
+        """
+        return [np.asarray(self.arrivals(time_horizon)) for _ in range(n)]
 
     def sample(self, n: int, time_horizon: float = 1, time_steps: int = 100) -> Paths:
         dt = time_horizon / time_steps
-        paths = np.zeros((time_steps + 1, n))
-        for p in range(n):
-            if arrivals := self.arrivals(time_horizon):
-                jumps = self.sample_jumps(len(arrivals))
-                i = 1
-                y = 0.0
-                for j, arrival in enumerate(arrivals):
-                    while i * dt < arrival:
-                        paths[i, p] = y
-                        i += 1
-                    y += jumps[j]
-                paths[i:, p] = y
+        paths = np.empty((time_steps + 1, n))
+        paths[0] = 0
+        grid = dt * np.arange(1, time_steps + 1)
+        for p, arrivals in enumerate(self.arrivals_batch(n, time_horizon)):
+            jumps = self.sample_jumps(len(arrivals))
+            process = np.concatenate(([0.0], np.cumsum(jumps)))
+            paths[1:, p] = process[np.searchsorted(arrivals, grid, side="right")]
         return Paths(t=time_horizon, data=paths)
 
     def sample_from_draws(self, draws: Paths, *args: Paths) -> Paths:
@@ -49,16 +53,36 @@ class PoissonBase(StochasticProcess1D):
         return Bounds(0, np.inf)
 
 
-def poisson_arrivals(intensity: float, time_horizon: float = 1) -> list[float]:
-    """Generate a list of jump arrivals times up to time t"""
-    exp_rate = 1.0 / intensity
+def poisson_arrivals(intensity: float, time_horizon: float = 1) -> FloatArray:
+    """Generate an array of jump arrival times up to time t
+
+    It uses the order-statistics construction of a Poisson process, the
+    number of arrivals is drawn once and the arrival times are sorted
+    uniform draws on the time interval.
+    """
+    arrivals = _rng.uniform(
+        0.0, time_horizon, size=_rng.poisson(intensity * time_horizon)
+    )
+    arrivals.sort()
+    return arrivals
+
+
+def poisson_arrivals_batch(
+    intensity: float, n: int, time_horizon: float = 1
+) -> list[FloatArray]:
+    """Generate jump arrival times for ``n`` paths in a single batch draw
+
+    All arrival counts and uniform draws are generated with one call each,
+    the flat array of draws is then split into one sorted segment per path.
+    """
+    counts = _rng.poisson(intensity * time_horizon, size=n)
+    draws = _rng.uniform(0.0, time_horizon, size=int(counts.sum()))
+    offsets = np.concatenate(([0], np.cumsum(counts)))
     arrivals = []
-    tt = 0.0
-    while tt < time_horizon:
-        dt = np.random.exponential(scale=exp_rate)
-        tt += dt
-        if tt <= time_horizon:
-            arrivals.append(tt)
+    for p in range(n):
+        section = draws[offsets[p] : offsets[p + 1]]
+        section.sort()
+        arrivals.append(section)
     return arrivals
 
 
@@ -69,14 +93,20 @@ class PoissonProcess(PoissonBase):
         return MarginalDiscrete1D(process=self, t=t)
 
     def characteristic_exponent(self, t: Vector, u: Vector) -> Vector:
-        return t * self.intensity * (1 - np.exp(Im * u))
+        # 1 - exp(iu) via the half-angle identity 2*sin(u/2)**2 - i*sin(u),
+        # which avoids the cancellation of exp(iu) - 1 at small frequencies
+        su = np.sin(0.5 * u)
+        return t * self.intensity * (2 * su * su - Im * np.sin(u))
 
-    def arrivals(self, time_horizon: float = 1) -> list[float]:
+    def arrivals(self, time_horizon: float = 1) -> FloatArray:
         return poisson_arrivals(self.intensity, time_horizon)
 
+    def arrivals_batch(self, n: int, time_horizon: float = 1) -> list[FloatArray]:
+        return poisson_arrivals_batch(self.intensity, n, time_horizon)
+
     def sample_jumps(self, n: int) -> np.ndarray:
         """For a poisson process this is just a list of 1s"""
-        return np.ones((n,))
+        return np.broadcast_to(1.0, (n,))
 
     def frequency_range(self, std: float, max_frequency: float | None = None) -> Bounds:
         """Frequency range of the process"""
@@ -134,8 +164,7 @@ class PoissonProcess(PoissonBase):
             n\right\rfloor }e^{-\lambda}}{\left\lfloor n\right\rfloor !}
         """
         k = np.floor(n).astype(int)
-        rate = self.intensity
-        return np.array([-(rate**k) * np.exp(-rate)]) / factorial(k)
+        return np.array([-poisson.pmf(k, self.intensity)])
 
 
 class CompoundPoissonProcess(PoissonBase, Generic[D]):
@@ -147,10 +176,14 @@ class CompoundPoissonProcess(PoissonBase, Generic[D]):
     def characteristic_exponent(self, t: FloatArrayLike, u: Vector) -> Vector:
         return t * self.intensity * (1 - self.jumps.characteristic(u))
 
-    def arrivals(self, time_horizon: float = 1) -> list[float]:
+    def arrivals(self, time_horizon: float = 1) -> FloatArray:
         """Same as Poisson process"""
         return poisson_arrivals(self.intensity, time_horizon)
 
+    def arrivals_batch(self, n: int, time_horizon: float = 1) -> list[FloatArray]:
+        """Same as Poisson process"""
+        return poisson_arrivals_batch(self.intensity, n, time_horizon)
+
     def sample_jumps(self, n: int) -> FloatArray:
         """Sample jump sizes from an exponential distribution with rate
         parameter :class:b
@@ -189,19 +222,22 @@ class MarginalDiscrete1D(StochasticProcess1DMarginal):
         c = self.characteristic(frequency)
         a = 1 / np.pi
         result = []
-        x = np.arange(n or 10)
+        x = np.arange(n)
+        # loop invariants - the sine denominator and the characteristic
+        # divided by it do not depend on m, and the per-m phase
+        # exp(-0.5j*m*frequency) is accumulated as a running product
+        d = np.sin(0.5 * frequency)
+        d[0] = 1.0
+        cd = c / d
+        phase_step = np.exp(-0.5 * Im * frequency)
+        phase = np.ones_like(phase_step)
         for m in x:
-            d = np.sin(0.5 * frequency)
-            d[0] = 1.0
-            f = (
-                np.sin(0.5 * (m + 1) * frequency)
-                * (c * np.exp(-0.5 * Im * m * frequency)).real
-                / d
-            )
+            f = np.sin(0.5 * (m + 1) * frequency) * (cd * phase).real
             f[0] = c[0].real  # type: ignore[index]
             if simpson_rule:
                 result.append(a * simpson(f, x=frequency))
             else:
                 result.append(a * np.trapz(f, frequency))
+            phase *= phase_step
         pdf = np.maximum(np.diff(result, prepend=0), 0)
         return TransformResult(x=x, y=np.cumsum(pdf))  # type: ignore[arg-type]
@@ -26,9 +26,11 @@ class WeinerProcess(StochasticProcess1D):
 
     def sample_from_draws(self, draws: Paths, *args: Paths) -> Paths:
         sdt = self.sigma * np.sqrt(draws.dt)
-        paths = np.zeros(draws.data.shape)
-        paths[1:] = np.cumsum(draws.data[:-1], axis=0)
-        return Paths(t=draws.t, data=sdt * paths)
+        paths = np.empty(draws.data.shape)
+        paths[0] = 0
+        np.multiply(draws.data[:-1], sdt, out=paths[1:])
+        np.cumsum(paths[1:], axis=0, out=paths[1:])
+        return Paths(t=draws.t, data=paths)
 
     def analytical_mean(self, t: FloatArrayLike) -> FloatArrayLike:
         return 0 * t
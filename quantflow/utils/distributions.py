@@ -6,6 +6,8 @@ from pydantic import Field
 from .marginal import Marginal1D
 from .types import FloatArray, Vector
 
+_rng = np.random.default_rng()
+
 
 class Distribution1D(Marginal1D):
     """Base class for 1D distributions to be used as
@@ -38,7 +40,7 @@ class Exponential(Distribution1D):
         return self.scale2
 
     def sample(self, n: int) -> np.ndarray:
-        return np.random.exponential(scale=self.scale, size=n)
+        return _rng.exponential(scale=self.scale, size=n)
 
     def support(self, points: int = 100, *, std_mult: float = 4) -> FloatArray:
         return np.linspace(0, std_mult * np.max(self.std()), points)
@@ -62,7 +64,7 @@ class Normal(Distribution1D):
         return self.sigma2
 
     def sample(self, n: int) -> np.ndarray:
-        return np.random.normal(loc=self.mu, scale=self.sigma, size=n)
+        return _rng.normal(loc=self.mu, scale=self.sigma, size=n)
 
     def support(self, points: int = 100, *, std_mult: float = 4) -> FloatArray:
         return np.linspace(
@@ -115,7 +117,7 @@ class DoubleExponential(Exponential):
         return self.scale2
 
     def sample(self, n: int) -> np.ndarray:
-        return np.random.exponential(scale=self.scale_up, size=n)
+        return _rng.exponential(scale=self.scale_up, size=n)
 
     def support(self, points: int = 100, *, std_mult: float = 4) -> FloatArray:
         return np.linspace(
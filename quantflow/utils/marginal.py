@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Callable, cast
+from typing import Callable
 
 import numpy as np
 import pandas as pd
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 from scipy.optimize import Bounds
 
 from .transforms import Transform, TransformResult, default_bounds
@@ -15,6 +15,16 @@ from .types import FloatArray, FloatArrayLike, Vector
 class Marginal1D(BaseModel, ABC, extra="forbid"):
     """Marginal distribution"""
 
+    _convexity: Vector | None = PrivateAttr(default=None)
+    _psi_cache: dict[tuple, tuple[Transform, np.ndarray]] = PrivateAttr(
+        default_factory=dict
+    )
+    _domain_range: Bounds | None = PrivateAttr(default=None)
+    _characteristic_diff: Vector | None = PrivateAttr(default=None)
+    _frequency_range_cache: dict[float | None, Bounds] = PrivateAttr(
+        default_factory=dict
+    )
+
     @abstractmethod
     def characteristic(self, u: Vector) -> Vector:
         """
@@ -59,25 +69,45 @@ class Marginal1D(BaseModel, ABC, extra="forbid"):
         """Standard deviation at a time horizon"""
         return np.sqrt(self.variance())
 
+    # finite difference step for derivatives of the characteristic function
+    _diff_step = 0.001
+
     def mean_from_characteristic(self) -> FloatArrayLike:
-        """Calculate mean as first derivative of characteristic function at 0"""
-        d = 0.001
-        m = -0.5 * 1j * (self.characteristic(d) - self.characteristic(-d)) / d
-        return cast(complex, m).real
+        """Calculate mean as first derivative of characteristic function at 0
+
+        By conjugate symmetry of the characteristic function of a real
+        random variable, the central difference
+        :math:`-0.5 i (\\phi(d) - \\phi(-d))/d` reduces to the imaginary
+        part of a single evaluation.
+        """
+        d = self._diff_step
+        return np.imag(self._characteristic_at_diff_step()) / d
 
     def std_from_characteristic(self) -> FloatArrayLike:
         """Calculate standard deviation as square root of variance"""
         return np.sqrt(self.variance_from_characteristic())
 
     def variance_from_characteristic(self) -> FloatArrayLike:
-        """Calculate variance as second derivative of characteristic function at 0"""
-        d = 0.001
-        c1 = self.characteristic(d)
-        c0 = self.characteristic(0)
-        c2 = self.characteristic(-d)
-        m = -0.5 * 1j * (c1 - c2) / d
-        s = -(c1 - 2 * c0 + c2) / (d * d) - m * m
-        return s.real
+        """Calculate variance as second derivative of characteristic function at 0
+
+        Uses :math:`\\phi(0) = 1` and conjugate symmetry
+        :math:`\\phi(-d) = \\overline{\\phi(d)}` so that the second-order
+        central difference requires a single characteristic evaluation.
+        """
+        d = self._diff_step
+        c = self._characteristic_at_diff_step()
+        m = np.imag(c) / d
+        return 2 * (1 - np.real(c)) / (d * d) - m * m
+
+    def _characteristic_at_diff_step(self) -> Vector:
+        """Characteristic function evaluated at the finite difference step
+
+        Cached so that mean, variance and standard deviation requested on
+        the same marginal share one characteristic evaluation.
+        """
+        if self._characteristic_diff is None:
+            self._characteristic_diff = self.characteristic(self._diff_step)
+        return self._characteristic_diff
 
     def cdf(self, x: FloatArrayLike) -> FloatArrayLike:
         """
@@ -120,15 +150,23 @@ class Marginal1D(BaseModel, ABC, extra="forbid"):
             Only needed for special cases/testing.
         :param simpson_rule: Use Simpson's rule for integration. Default is False.
         :param use_fft: Use FFT for the transform. Default is False.
+
+        The frequency grid and the characteristic function evaluated on it
+        are cached per parameter set, so repeated calls with the same
+        discretization reuse the evaluation.
         """
-        transform = self.get_transform(
-            frequency_n or n,
-            self.support,
-            max_frequency=max_frequency,
-            simpson_rule=simpson_rule,
-            use_fft=use_fft,
-        )
-        psi = cast(np.ndarray, self.characteristic(transform.frequency_domain))
+        key = (frequency_n or n, max_frequency, simpson_rule, use_fft)
+        if (cached := self._psi_cache.get(key)) is None:
+            transform = self.get_transform(
+                frequency_n or n,
+                self.support,
+                max_frequency=max_frequency,
+                simpson_rule=simpson_rule,
+                use_fft=use_fft,
+            )
+            psi = np.asarray(self.characteristic(transform.frequency_domain))
+            self._psi_cache[key] = cached = (transform, psi)
+        transform, psi = cached
         return transform(psi, use_fft=use_fft)
 
     def cdf_from_characteristic(
@@ -160,12 +198,14 @@ class Marginal1D(BaseModel, ABC, extra="forbid"):
             use_fft=use_fft,
         )
         alpha = alpha or self.option_alpha()
-        phi = cast(
-            np.ndarray,
-            self.call_option_transform(transform.frequency_domain - 1j * alpha),
+        phi = np.asarray(
+            self.call_option_transform(transform.frequency_domain - 1j * alpha)
         )
         result = transform(phi, use_fft=use_fft)
-        return TransformResult(x=result.x, y=result.y * np.exp(-alpha * result.x))
+        # damp in place - the exp output doubles as the result buffer
+        y = np.exp(result.x * (-alpha))
+        np.multiply(y, result.y, out=y)
+        return TransformResult(x=result.x, y=y)
 
     def option_time_value(
         self,
@@ -185,9 +225,8 @@ class Marginal1D(BaseModel, ABC, extra="forbid"):
             simpson_rule=simpson_rule,
             use_fft=use_fft,
         )
-        phi = cast(
-            np.ndarray,
-            self.option_time_value_transform(transform.frequency_domain, alpha),
+        phi = np.asarray(
+            self.option_time_value_transform(transform.frequency_domain, alpha)
         )
         result = transform(phi, use_fft=use_fft)
         time_value = result.y / np.sinh(alpha * result.x)
@@ -210,8 +249,8 @@ class Marginal1D(BaseModel, ABC, extra="forbid"):
             max_frequency=max_frequency,
             simpson_rule=simpson_rule,
         )
-        psi = self.characteristic(transform.frequency_domain)
-        return transform.characteristic_df(cast(np.ndarray, psi))
+        psi = np.asarray(self.characteristic(transform.frequency_domain))
+        return transform.characteristic_df(psi)
 
     def get_transform(
         self,
@@ -224,13 +263,18 @@ class Marginal1D(BaseModel, ABC, extra="forbid"):
     ) -> Transform:
         n = n or 128
         if use_fft:
-            bounds = self.domain_range()
+            if self._domain_range is None:
+                self._domain_range = self.domain_range()
+            bounds = self._domain_range
         else:
             x = support(n)
             bounds = Bounds(float(np.min(x)), float(np.max(x)))
+        if (frequency_range := self._frequency_range_cache.get(max_frequency)) is None:
+            frequency_range = self.frequency_range(max_frequency)
+            self._frequency_range_cache[max_frequency] = frequency_range
         return Transform.create(
             n,
-            frequency_range=self.frequency_range(max_frequency),
+            frequency_range=frequency_range,
             domain_range=bounds,
             simpson_rule=simpson_rule,
         )
@@ -269,8 +313,9 @@ class Marginal1D(BaseModel, ABC, extra="forbid"):
         return self.characteristic_corrected(u - 1j) / (uj * uj + uj)
 
     def characteristic_corrected(self, u: Vector) -> Vector:
-        convexity = np.log(self.characteristic(-1j))
-        return self.characteristic(u) * np.exp(-1j * u * convexity)
+        if self._convexity is None:
+            self._convexity = np.log(self.characteristic(-1j))
+        return self.characteristic(u) * np.exp(-1j * u * self._convexity)
 
     def option_time_value_transform(self, u: Vector, alpha: float = 1.1) -> Vector:
         """Option time value transform
@@ -1,17 +1,18 @@
 from __future__ import annotations
 
+from functools import cached_property
 from typing import Any, cast
 
 import numpy as np
 import pandas as pd
-from numpy.random import normal
 from pydantic import BaseModel, Field
-from scipy.integrate import cumulative_trapezoid
 
 from . import plot
 from .bins import pdf as bins_pdf
 from .types import FloatArray
 
+_rng = np.random.default_rng()
+
 
 class Paths(BaseModel, arbitrary_types_allowed=True):
     """Paths of a stochastic process"""
@@ -33,7 +34,7 @@ class Paths(BaseModel, arbitrary_types_allowed=True):
         """Number of time steps"""
         return self.data.shape[0] - 1
 
-    @property
+    @cached_property
     def time(self) -> FloatArray:
         """Time as numpy array"""
         return np.linspace(0.0, self.t, num=self.time_steps + 1)
@@ -44,9 +45,10 @@ class Paths(BaseModel, arbitrary_types_allowed=True):
         return pd.DataFrame(self.data, index=self.time)
 
     @property
-    def xs(self) -> list[np.ndarray]:
-        """Time as list of list (for visualization tools)"""
-        return self.samples * [self.time]
+    def xs(self) -> FloatArray:
+        """Time for each sample as a read-only broadcast view
+        (for visualization tools)"""
+        return np.broadcast_to(self.time, (self.samples, self.time_steps + 1))
 
     @property
     def ys(self) -> list[list[float]]:
@@ -66,11 +68,13 @@ class Paths(BaseModel, arbitrary_types_allowed=True):
         return np.var(self.data, axis=1)
 
     def integrate(self) -> Paths:
-        """Integrate paths"""
-        return self.__class__(
-            t=self.t,
-            data=cumulative_trapezoid(self.data, dx=self.dt, axis=0, initial=0),
-        )
+        """Integrate paths with the trapezoid rule"""
+        data = self.data
+        out = np.empty_like(data)
+        out[0] = 0
+        np.cumsum(data[:-1] + data[1:], axis=0, out=out[1:])
+        out[1:] *= 0.5 * self.dt
+        return self.__class__(t=self.t, data=out)
 
     def cross_section(self, t: float | None = None) -> FloatArray:
         """Cross section of paths at time t"""
@@ -122,15 +126,13 @@ class Paths(BaseModel, arbitrary_types_allowed=True):
         :param time_steps: number of time steps to arrive at horizon
         :param antithetic_variates: whether to use antithetic variates
         """
-        time_horizon / time_steps
-        odd = 0
-        if antithetic_variates:
-            odd = paths % 2
-            paths = paths // 2
-        data = normal(size=(time_steps + 1, paths))
         if antithetic_variates:
-            data = np.concatenate((data, -data), axis=1)
-            if odd:
-                extra_data = normal(size=(time_steps + 1, odd))
-                data = np.concatenate((data, extra_data), axis=1)
+            half = paths // 2
+            data = np.empty((time_steps + 1, paths))
+            data[:, :half] = _rng.standard_normal((time_steps + 1, half))
+            np.negative(data[:, :half], out=data[:, half : 2 * half])
+            if paths % 2:
+                data[:, -1] = _rng.standard_normal(time_steps + 1)
+        else:
+            data = _rng.standard_normal((time_steps + 1, paths))
         return cls(t=time_horizon, data=data)
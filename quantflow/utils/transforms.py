@@ -6,6 +6,7 @@ from typing import Any, NamedTuple
 import numpy as np
 import numpy.typing as npt
 import pandas as pd
+from scipy.fft import fft, ifft
 from scipy.optimize import Bounds
 
 from .types import FloatArray
@@ -132,7 +133,9 @@ class Transform:
     def fft(self, y: np.ndarray) -> TransformResult:
         """Transform using the Fast Fourier Transform"""
         x, f = self.transform(y, self.fft_delta_x)
-        return TransformResult(x=x, y=np.fft.fft(f).real / self.n)
+        # f is a temporary built by transform, so pocketfft may overwrite it
+        r = fft(f, workers=-1, overwrite_x=True).real / self.n
+        return TransformResult(x=x, y=r)
 
     def frft(self, y: np.ndarray) -> TransformResult:
         """Transform using the Fractional Fourier Transform"""
@@ -146,33 +149,21 @@ class Transform:
             raise TransformError("shapes not compatible")
         x = self.space_domain(delta_x)
         b = -x[0]
-        t = (
-            self.h
-            * self.n
-            * np.exp(1j * self.frequency_domain * b)
-            * y
-            * self.delta_f
-            / np.pi
-        )
+        # assemble exp(i*w*b) from real cos/sin evaluations, keeping the
+        # phase calculation on float64 arrays rather than a complex exp
+        wb = self.frequency_domain * b
+        phase = np.empty(wb.shape, dtype=np.complex128)
+        np.cos(wb, out=phase.real)
+        np.sin(wb, out=phase.imag)
+        t = self.h * (self.n * self.delta_f / np.pi) * phase * y
         return TransformResult(x=x, y=t)
 
     def characteristic_df(self, psi: np.ndarray) -> pd.DataFrame:
-        return pd.concat(
-            (
-                pd.DataFrame(
-                    dict(
-                        frequency=self.frequency_domain,
-                        characteristic=psi.real,
-                        name="real",
-                    )
-                ),
-                pd.DataFrame(
-                    dict(
-                        frequency=self.frequency_domain,
-                        characteristic=psi.imag,
-                        name="iamg",
-                    )
-                ),
+        return pd.DataFrame(
+            dict(
+                frequency=np.tile(self.frequency_domain, 2),
+                characteristic=np.concatenate((psi.real, psi.imag)),
+                name=np.repeat(["real", "imag"], self.n),
             )
         )
 
@@ -204,9 +195,9 @@ class FrFT:
         ezi = 1 / ez
         y = np.concatenate((x * ezi, np.zeros(n)))
         z = np.concatenate((ez, ez2))
-        fft_y = np.fft.fft(y)
-        fft_z = np.fft.fft(z)
-        y_z = np.fft.ifft(fft_y * fft_z) / n
+        fft_y = fft(y, workers=-1)
+        fft_z = fft(z, workers=-1)
+        y_z = ifft(fft_y * fft_z, workers=-1, overwrite_x=True) / n
         result = ezi * y_z[:n]
         return cls(
             result=result,